@@ -13,25 +13,53 @@ log = logging.getLogger(__name__)
 
 @hydra.main(version_base=None, config_path=".", config_name="config")
 def train(cfg: DictConfig) -> None:
-    log.info(f"Node: {platform.node()}, PID: {os.getpid()}")
-    log.info(f"Training with lr={cfg.lr}, batch_size={cfg.batch_size}, seed={cfg.seed}")
-    log.info(f"Epochs: {cfg.num_epochs}")
+    log.info("Node: %s, PID: %d", platform.node(), os.getpid())
+    log.info(
+        "Training with lr=%s, batch_size=%s, seed=%s", cfg.lr, cfg.batch_size, cfg.seed
+    )
+    log.info("Epochs: %s", cfg.num_epochs)
 
-    # log nvidia-smi output
+    # log GPU information, queried directly through NVML
     try:
-        import subprocess
+        import pynvml
 
-        nvidia_smi = subprocess.check_output(["nvidia-smi"]).decode("utf-8")
-        log.info("nvidia-smi output:\n" + nvidia_smi)
-    except Exception as e:
-        log.warning(f"Could not run nvidia-smi: {e}")
+        pynvml.nvmlInit()
+        try:
+            for i in range(pynvml.nvmlDeviceGetCount()):
+                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                name = pynvml.nvmlDeviceGetName(handle)
+                if isinstance(name, bytes):  # older nvidia-ml-py releases
+                    name = name.decode("utf-8")
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                log.info(
+                    "GPU %d: %s, memory %dMiB / %dMiB, utilization %d%%",
+                    i,
+                    name,
+                    mem.used // 2**20,
+                    mem.total // 2**20,
+                    util.gpu,
+                )
+        finally:
+            pynvml.nvmlShutdown()
+    except ImportError:
+        log.warning("Could not query GPUs: nvidia-ml-py is not installed")
+    except pynvml.NVMLError as e:
+        log.warning("Could not query GPUs: %s", e)
 
-    # Simulate training loop
-    for epoch in range(cfg.num_epochs):
+    # Bind config values once; OmegaConf attribute access is not free
+    lr = float(cfg.lr)
+    num_epochs = int(cfg.num_epochs)
+    log_every = 10
+
+    # Simulate training loop: one minute per epoch, logging every `log_every`
+    for epoch in range(0, num_epochs, log_every):
         time.sleep(60)  # Wait for 1 minute
-        loss = 1.0 / (epoch + 1) * cfg.lr
-        if epoch % 10 == 0:
-            log.info(f"  Epoch {epoch}/{cfg.num_epochs}, loss={loss:.6f}")
+        if log.isEnabledFor(logging.INFO):
+            loss = lr / (epoch + 1)
+            log.info("  Epoch %d/%d, loss=%.6f", epoch, num_epochs, loss)
+        # the remaining epochs of this stride are not logged
+        time.sleep(60 * (min(log_every, num_epochs - epoch) - 1))
 
     log.info("Training complete.")
 
@@ -12,13 +12,21 @@ log = logging.getLogger(__name__)
 
 @hydra.main(version_base=None, config_path=".", config_name="config")
 def my_app(cfg: DictConfig) -> None:
-    log.info(f"Hello from {platform.node()}!")
-    log.info(f"PID: {os.getpid()}")
-    log.info(f"Python: {platform.python_version()} at {os.path.dirname(platform.python_compiler())}")
-    log.info(f"Config: greeting={cfg.greeting}, repeat={cfg.repeat}")
-
-    for i in range(cfg.repeat):
-        log.info(f"  {cfg.greeting} (#{i + 1})")
+    # Queried inside the job, not at import time: this function is pickled on
+    # the login node and must report the node and Python it actually runs on
+    log.info("Hello from %s!", platform.node())
+    log.info("PID: %d", os.getpid())
+    log.info(
+        "Python: %s at %s",
+        platform.python_version(),
+        os.path.dirname(platform.python_compiler()),
+    )
+    log.info("Config: greeting=%s, repeat=%s", cfg.greeting, cfg.repeat)
+
+    if log.isEnabledFor(logging.INFO):
+        greeting = cfg.greeting
+        for i in range(cfg.repeat):
+            log.info("  %s (#%d)", greeting, i + 1)
 
 
 if __name__ == "__main__":
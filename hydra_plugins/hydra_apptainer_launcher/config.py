@@ -9,6 +9,8 @@ from hydra.core.config_store import ConfigStore
 class BaseQueueConf:
     """Configuration shared by all executors"""
 
+    # where submitit exchanges pickled jobs, results and logs; for SLURM it
+    # must be on a filesystem shared by the login and compute nodes
     submitit_folder: str = "${hydra.sweep.dir}/.submitit/%j"
 
     # maximum time for the job in minutes
@@ -72,6 +74,10 @@ class SlurmQueueConf(BaseQueueConf):
     additional_parameters: Dict[str, Any] = field(default_factory=dict)
     # Maximum number of jobs running in parallel
     array_parallelism: int = 256
+    # Maximum delay in seconds between two job state queries. submitit polls
+    # the state of all jobs of the sweep with a single cached sacct call;
+    # None keeps its default (600s).
+    polling_interval_s: Optional[int] = None
     # A list of commands to run in sbatch before running srun
     setup: Optional[List[str]] = None
     # Any additional arguments that should be passed to srun
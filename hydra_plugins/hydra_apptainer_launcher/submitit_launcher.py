@@ -151,3 +151,29 @@ class CustomLocalLauncher(CustomBaseSubmititLauncher):
 
 class CustomSlurmLauncher(CustomBaseSubmititLauncher):
     _EXECUTOR = "slurm"
+
+    def __init__(self, **params: Any) -> None:
+        # not an executor parameter: it tunes submitit's shared sacct watcher
+        self.polling_interval_s: Optional[int] = params.pop(
+            "polling_interval_s", None
+        )
+        super().__init__(**params)
+
+    def launch(
+        self, job_overrides: Sequence[Sequence[str]], initial_job_idx: int
+    ) -> Sequence[JobReturn]:
+        if self.polling_interval_s is None:
+            return super().launch(job_overrides, initial_job_idx)
+
+        # lazy import to ensure plugin discovery remains fast
+        from submitit.slurm.slurm import SlurmInfoWatcher, SlurmJob
+
+        # all SlurmJobs share this watcher, which queries every pending job
+        # with a single sacct call and serves the rest from its cache. Swap it
+        # only for this launch so other launchers keep submitit's default.
+        previous_watcher = SlurmJob.watcher
+        SlurmJob.watcher = SlurmInfoWatcher(delay_s=self.polling_interval_s)
+        try:
+            return super().launch(job_overrides, initial_job_idx)
+        finally:
+            SlurmJob.watcher = previous_watcher
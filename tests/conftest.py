@@ -1,7 +1,15 @@
+import functools
+import os
 import shutil
+import stat
+import subprocess
 
 import pytest
 
+# Unique per process (one per pytest-xdist worker) so parallel or repeated
+# sessions never collide with an instance left behind by a crashed run
+APPTAINER_INSTANCE_NAME = f"hydra_test_inst_{os.getpid()}"
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -12,7 +20,7 @@ def pytest_addoption(parser):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sif_path(request):
     """Return the --sif-path value, or skip if not provided."""
     path = request.config.getoption("--sif-path")
@@ -21,9 +29,89 @@ def sif_path(request):
     return path
 
 
+@pytest.fixture(scope="session")
+def warm_sif_page_cache(sif_path, sif_stat):
+    """Read the image once so the instance start hits the page cache.
+
+    Only the login-side ``apptainer_instance`` benefits: SLURM jobs read the
+    image on the compute nodes.
+    """
+    with open(sif_path, "rb") as f:
+        for _ in range(0, sif_stat.st_size, 1 << 20):
+            f.read(1 << 20)
+
+
+@pytest.fixture(scope="session")
+def subprocess_env():
+    """Environment for the Python child processes spawned by the tests.
+
+    Skips .pyc writes for the throw-away apps and pins the hash seed so
+    child runs are reproducible; variables already set by the caller win.
+    """
+    return {"PYTHONDONTWRITEBYTECODE": "1", "PYTHONHASHSEED": "0", **os.environ}
+
+
+@functools.lru_cache(maxsize=1)
 def has_sbatch():
     return shutil.which("sbatch") is not None
 
 
+@functools.lru_cache(maxsize=1)
 def has_apptainer():
     return shutil.which("apptainer") is not None
+
+
+@pytest.fixture(scope="session")
+def sif_stat(sif_path):
+    """Stat the --sif-path image once per session, failing if it is missing."""
+    try:
+        st = os.stat(sif_path)
+    except FileNotFoundError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        pytest.fail(f"Apptainer image not found: {sif_path}")
+    return st
+
+
+@pytest.fixture(scope="session")
+def apptainer_instance(request):
+    """Start one Apptainer instance of the image for the whole test session.
+
+    Returns the ``instance://`` URI so tests can ``apptainer exec`` into the
+    already running container instead of paying a cold start per command.
+    """
+    if not has_apptainer():
+        pytest.skip("apptainer not available")
+    # requested lazily so a missing apptainer is reported before --sif-path
+    sif_path = request.getfixturevalue("sif_path")
+    request.getfixturevalue("warm_sif_page_cache")
+
+    # The probes are stateless `python -c` calls: an isolated environment
+    # without the PID-namespace init shim is enough and starts faster
+    try:
+        subprocess.run(
+            [
+                "apptainer",
+                "instance",
+                "start",
+                "--containall",
+                "--no-init",
+                sif_path,
+                APPTAINER_INSTANCE_NAME,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except subprocess.CalledProcessError as e:
+        pytest.fail(
+            f"Could not start Apptainer instance {APPTAINER_INSTANCE_NAME}:\n"
+            f"{e.stderr}"
+        )
+    yield f"instance://{APPTAINER_INSTANCE_NAME}"
+    subprocess.run(
+        ["apptainer", "instance", "stop", APPTAINER_INSTANCE_NAME],
+        capture_output=True,
+        timeout=60,
+    )
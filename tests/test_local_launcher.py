@@ -1,17 +1,75 @@
-"""Integration test: run a Hydra multirun job via CustomLocalLauncher."""
+"""Integration tests: run Hydra multirun jobs via the local launcher."""
 
+import os
+import select
 import subprocess
 import sys
+import time
+from collections import deque
 from pathlib import Path
 
-import pytest
+from hydra import compose, initialize_config_dir
+from hydra._internal.callbacks import Callbacks
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.utils import JobStatus
+from hydra.types import HydraContext
+from hydra.utils import instantiate
+from omegaconf import DictConfig, OmegaConf, open_dict
+
+from hydra_plugins.hydra_apptainer_launcher.config import LocalQueueConf
 
 EXAMPLES_DIR = Path(__file__).parent.parent / "examples" / "hello_cluster"
 
 
-def test_local_launcher_hello(tmp_path):
+def _run_streaming(argv, cwd, timeout, env=None, max_lines=2000):
+    """Run a command like ``subprocess.run(capture_output=True, text=True)``.
+
+    Output is drained while the child runs and only the last ``max_lines``
+    lines of each stream are kept, so memory stays bounded on large sweeps.
+    The child is killed if it outlives ``timeout`` seconds.
+    """
+    proc = subprocess.Popen(
+        argv, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    tails = {proc.stdout: deque(maxlen=max_lines), proc.stderr: deque(maxlen=max_lines)}
+    partial = {proc.stdout: b"", proc.stderr: b""}
+    open_streams = list(tails)
+    deadline = time.monotonic() + timeout
+    try:
+        while open_streams:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(argv, timeout)
+            readable, _, _ = select.select(open_streams, [], [], remaining)
+            for stream in readable:
+                chunk = os.read(stream.fileno(), 1 << 16)
+                if not chunk:
+                    open_streams.remove(stream)
+                    if partial[stream]:
+                        tails[stream].append(partial[stream])
+                    continue
+                *lines, partial[stream] = (partial[stream] + chunk).split(b"\n")
+                tails[stream].extend(lines)
+        returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+
+    def _text(lines):
+        return "\n".join(line.decode(errors="replace") for line in lines)
+
+    return subprocess.CompletedProcess(
+        argv, returncode, _text(tails[proc.stdout]), _text(tails[proc.stderr])
+    )
+
+
+def test_local_launcher_hello(tmp_path, subprocess_env):
     """Run the hello_cluster example with the local executor (no SLURM needed)."""
-    result = subprocess.run(
+    result = _run_streaming(
         [
             sys.executable,
             str(EXAMPLES_DIR / "hello.py"),
@@ -21,10 +79,9 @@ def test_local_launcher_hello(tmp_path):
             "greeting=Hello,Hola",
             "repeat=1",
         ],
-        capture_output=True,
-        text=True,
         cwd=str(EXAMPLES_DIR),
         timeout=120,
+        env=subprocess_env,
     )
 
     if result.returncode != 0:
@@ -39,47 +96,45 @@ def test_local_launcher_hello(tmp_path):
 
 
 def test_local_launcher_returns_results(tmp_path):
-    """Verify the local launcher actually executes the task function."""
-    script = tmp_path / "marker_app.py"
-    config = tmp_path / "marker_config.yaml"
-    marker = tmp_path / "marker.txt"
+    """Verify the local launcher actually executes the task function.
 
-    script.write_text(
-        f"""\
-import hydra
-from omegaconf import DictConfig
-from pathlib import Path
-
-@hydra.main(version_base=None, config_path=".", config_name="marker_config")
-def app(cfg: DictConfig) -> None:
-    Path("{marker}").write_text(f"executed with value={{cfg.value}}")
-
-if __name__ == "__main__":
-    app()
-"""
-    )
-
-    config.write_text("value: 42\n")
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            str(script),
-            "-m",
-            f"hydra.sweep.dir={tmp_path / 'sweep'}",
-            "hydra/launcher=submitit_local",
-            "value=42",
-        ],
-        capture_output=True,
-        text=True,
-        cwd=str(tmp_path),
-        timeout=120,
-    )
-
-    if result.returncode != 0:
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-
-    assert result.returncode == 0, f"Process failed with:\n{result.stderr}"
+    Runs in-process: the config is composed with the compose API and the
+    launcher is driven directly, only the job itself runs in a subprocess.
+    """
+    marker = tmp_path / "marker.txt"
+    (tmp_path / "marker_config.yaml").write_text("value: 0\n")
+
+    def task(cfg: DictConfig) -> str:
+        Path(marker).write_text(f"executed with value={cfg.value}")
+        return "done"
+
+    with initialize_config_dir(config_dir=str(tmp_path), version_base=None):
+        cfg = compose(
+            config_name="marker_config",
+            overrides=[f"hydra.sweep.dir={tmp_path / 'sweep'}"],
+            return_hydra_config=True,
+        )
+        # Set the launcher node explicitly: the upstream hydra-submitit-launcher
+        # registers the same "submitit_local" name
+        with open_dict(cfg):
+            cfg.hydra.launcher = OmegaConf.structured(LocalQueueConf)
+
+        launcher = instantiate(cfg.hydra.launcher)
+        launcher.setup(
+            hydra_context=HydraContext(
+                config_loader=GlobalHydra.instance().config_loader(),
+                # HydraContext requires a Callbacks container and hydra-core
+                # exposes no public way to build one outside hydra.main
+                callbacks=Callbacks(cfg),
+            ),
+            task_function=task,
+            config=cfg,
+        )
+        returns = launcher.launch([["value=42"]], initial_job_idx=0)
+
+    assert len(returns) == 1
+    # return_value re-raises the job's exception if the task failed
+    assert returns[0].return_value == "done"
+    assert returns[0].status == JobStatus.COMPLETED
     assert marker.exists(), "Marker file not created — task function did not execute"
     assert "executed with value=42" in marker.read_text()
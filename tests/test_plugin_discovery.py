@@ -1,27 +1,44 @@
 """Test that Hydra discovers the plugin via namespace packages."""
 
+from pathlib import Path
+
 import pytest
+from hydra.core.config_store import ConfigStore
+from hydra.plugins.launcher import Launcher
+
+from hydra_plugins.hydra_apptainer_launcher.config import (
+    BaseQueueConf,
+    LocalQueueConf,
+    SlurmQueueConf,
+)
+from hydra_plugins.hydra_apptainer_launcher.submitit_launcher import (
+    CustomLocalLauncher,
+    CustomSlurmLauncher,
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+
+cs = ConfigStore.instance()
+
+
+def _declared_packages():
+    """Return the ``[tool.setuptools] packages`` list from pyproject.toml."""
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python < 3.11
+        tomllib = pytest.importorskip("tomli")
+    with open(REPO_ROOT / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)["tool"]["setuptools"]["packages"]
 
 
 def test_import_launcher_classes():
     """Verify that both launcher classes are importable."""
-    from hydra_plugins.hydra_apptainer_launcher.submitit_launcher import (
-        CustomLocalLauncher,
-        CustomSlurmLauncher,
-    )
-
     assert CustomLocalLauncher._EXECUTOR == "local"
     assert CustomSlurmLauncher._EXECUTOR == "slurm"
 
 
 def test_import_config_classes():
     """Verify the config dataclasses are importable and have expected fields."""
-    from hydra_plugins.hydra_apptainer_launcher.config import (
-        BaseQueueConf,
-        LocalQueueConf,
-        SlurmQueueConf,
-    )
-
     base = BaseQueueConf()
     assert base.timeout_min == 60
     assert base.python is None
@@ -29,6 +46,7 @@ def test_import_config_classes():
     slurm = SlurmQueueConf()
     assert slurm.partition is None
     assert slurm.array_parallelism == 256
+    assert slurm.polling_interval_s is None
 
     local = LocalQueueConf()
     assert local.timeout_min == 60
@@ -36,22 +54,22 @@ def test_import_config_classes():
 
 def test_launcher_inherits_from_hydra_launcher():
     """Verify our launchers implement the Hydra Launcher interface."""
-    from hydra.plugins.launcher import Launcher
-    from hydra_plugins.hydra_apptainer_launcher.submitit_launcher import (
-        CustomLocalLauncher,
-        CustomSlurmLauncher,
-    )
-
     assert issubclass(CustomSlurmLauncher, Launcher)
     assert issubclass(CustomLocalLauncher, Launcher)
 
 
 def test_config_store_registration():
     """Verify that launcher configs are registered in Hydra's ConfigStore."""
-    from hydra.core.config_store import ConfigStore
-
-    cs = ConfigStore.instance()
     # Access the registered configs — these should exist without raising
     repo = cs.repo
     # The configs are stored under hydra/launcher group
     assert repo is not None
+
+
+def test_declared_packages_match_source_tree():
+    """Verify the explicit package list covers every plugin package on disk."""
+    setuptools = pytest.importorskip("setuptools")
+    on_disk = setuptools.find_namespace_packages(
+        where=str(REPO_ROOT), include=["hydra_plugins.*"]
+    )
+    assert sorted(_declared_packages()) == sorted(on_disk)
@@ -10,18 +10,26 @@ Requirements:
   - Requires a .sif container image (passed via --sif-path)
 
 Usage:
-  pytest tests/test_slurm_cluster.py -v -m slurm --sif-path /path/to/container.sif
+  pytest tests/test_slurm_cluster.py -v -m slurm --sif-path /path/to/container.sif \
+      --basetemp /shared/scratch/$USER/pytest
 
 The container must have hydra-apptainer-launcher installed inside it.
+
+Everything under tmp_path must live on a filesystem shared by the login and
+compute nodes: the job re-reads the app config, writes its marker there, and
+submitit exchanges the pickled job and its result through submitit_folder.
+pytest puts tmp_path under the node-local /tmp by default, hence --basetemp.
 """
 
+import ast
 import os
 import shutil
 import subprocess
 import sys
 import textwrap
+import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -45,15 +53,21 @@ def apptainer_available():
 
 
 @pytest.fixture
-def sif_exists(sif_path):
+def sif_exists(request):
     """Verify the .sif file actually exists."""
-    if not Path(sif_path).is_file():
-        pytest.fail(f"Apptainer image not found: {sif_path}")
+    # sif_path and sif_stat are session-scoped and would otherwise be set up
+    # before the function-scoped availability skips; request them lazily
+    sif_path = request.getfixturevalue("sif_path")
+    request.getfixturevalue("sif_stat")
     return sif_path
 
 
 def _create_test_app(tmp_path, marker_file, sif_path):
-    """Create a minimal Hydra app + config + launcher YAML for testing."""
+    """Create a minimal Hydra app + config + launcher YAML for testing.
+
+    ``marker_file`` may contain a ``{value}`` placeholder, filled with the
+    job's ``cfg.value`` so every job of a sweep writes its own marker.
+    """
     scripts_dir = tmp_path / "scripts"
     scripts_dir.mkdir()
     launcher_dir = scripts_dir / "hydra" / "launcher"
@@ -71,16 +85,18 @@ def _create_test_app(tmp_path, marker_file, sif_path):
             from pathlib import Path
 
             import hydra
+            from hydra.core.hydra_config import HydraConfig
             from omegaconf import DictConfig
 
             log = logging.getLogger(__name__)
 
             @hydra.main(version_base=None, config_path=".", config_name="config")
             def app(cfg: DictConfig) -> None:
-                marker = Path("{marker_file}")
+                marker = Path("{marker_file}".format(value=cfg.value))
                 info = {{
                     "node": platform.node(),
                     "pid": os.getpid(),
+                    "job_id": HydraConfig.get().job.id,
                     "python": sys.executable,
                     "value": cfg.value,
                     "inside_container": os.path.exists("/.singularity.d") or os.path.exists("/etc/apptainer"),
@@ -119,21 +135,68 @@ def _create_test_app(tmp_path, marker_file, sif_path):
 
 
 def _wait_for_marker(marker_file, timeout_seconds=300, poll_interval=5):
-    """Poll until the marker file appears or timeout is reached."""
-    elapsed = 0
-    while elapsed < timeout_seconds:
-        if marker_file.is_file():
-            return True
-        time.sleep(poll_interval)
-        elapsed += poll_interval
-    return False
-
-
+    """Wait until the marker file appears or timeout is reached.
+
+    Blocks on filesystem events for the marker's directory so a write is
+    noticed as soon as it happens. Writes made by another NFS client do not
+    always raise an event on this host, so the file is still re-checked at
+    least every ``poll_interval`` seconds.
+    """
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    deadline = time.monotonic() + timeout_seconds
+    target = str(marker_file)
+    parent, name = marker_file.parent, marker_file.name
+    written = threading.Event()
+
+    def _marker_present():
+        # One readdir instead of a stat: DirEntry.is_file() uses d_type
+        with os.scandir(parent) as entries:
+            return any(
+                e.name == name and e.is_file(follow_symlinks=False) for e in entries
+            )
+
+    class _MarkerHandler(FileSystemEventHandler):
+        def on_closed(self, event):
+            if event.src_path == target:
+                written.set()
+
+        def on_moved(self, event):
+            if event.dest_path == target:
+                written.set()
+
+    # Race guard: the job may already be done before the watch is in place
+    if _marker_present():
+        return True
+
+    observer = Observer()
+    observer.schedule(_MarkerHandler(), str(parent))
+    observer.start()
+    try:
+        while True:
+            if _marker_present():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            written.wait(timeout=min(remaining, poll_interval))
+    finally:
+        observer.stop()
+        observer.join()
+
+
+@pytest.mark.xdist_group("slurm_cluster")
 class TestSlurmApptainer:
     """Tests that require a SLURM cluster and an Apptainer .sif image."""
 
     def test_submit_and_run_in_container(
-        self, tmp_path, cluster_available, apptainer_available, sif_exists
+        self,
+        tmp_path,
+        cluster_available,
+        apptainer_available,
+        sif_exists,
+        subprocess_env,
     ):
         """Submit a job to SLURM that runs inside the Apptainer container.
 
@@ -160,6 +223,7 @@ class TestSlurmApptainer:
             text=True,
             cwd=str(scripts_dir),
             timeout=120,
+            env=subprocess_env,
         )
 
         if result.returncode != 0:
@@ -193,45 +257,96 @@ class TestSlurmApptainer:
             f"Marker file doesn't contain expected value. Content: {content}"
         )
 
-    def test_container_has_plugin(self, apptainer_available, sif_exists):
-        """Verify the container has hydra-apptainer-launcher installed."""
+    def test_multirun_is_one_job_array(
+        self,
+        tmp_path,
+        cluster_available,
+        apptainer_available,
+        sif_exists,
+        subprocess_env,
+    ):
+        """A 4-job sweep is submitted as a single SLURM array, not 4 jobs."""
+        marker_file = tmp_path / "slurm_marker_{value}.txt"
+        app_py = _create_test_app(tmp_path, marker_file, sif_exists)
+        values = ["a", "b", "c", "d"]
+
         result = subprocess.run(
             [
-                "apptainer",
-                "exec",
-                sif_exists,
-                "python",
-                "-c",
-                "from hydra_plugins.hydra_apptainer_launcher.submitit_launcher import CustomSlurmLauncher; print('OK')",
+                sys.executable,
+                str(app_py),
+                "-m",
+                f"hydra.sweep.dir={tmp_path / 'sweep'}",
+                "hydra/launcher=submitit_apptainer",
+                f"value={','.join(values)}",
             ],
             capture_output=True,
             text=True,
-            timeout=30,
+            cwd=str(app_py.parent),
+            timeout=120,
+            env=subprocess_env,
         )
-
         assert result.returncode == 0, (
-            f"Plugin import failed inside container:\n{result.stderr}\n"
-            f"Make sure hydra-apptainer-launcher is installed in the .sif image."
-        )
-        assert "OK" in result.stdout
-
-    def test_container_python_works(self, apptainer_available, sif_exists):
-        """Basic sanity check: Python runs inside the container."""
-        result = subprocess.run(
-            [
-                "apptainer",
-                "exec",
-                sif_exists,
-                "python",
-                "-c",
-                "import sys; print(f'Python {sys.version}')",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+            f"Job submission failed:\n{result.stderr}"
         )
 
-        assert result.returncode == 0, (
-            f"Python failed inside container:\n{result.stderr}"
+        # One scheduling + execution budget shared by the whole array
+        deadline = time.monotonic() + 300
+        job_ids = []
+        for value in values:
+            marker = tmp_path / f"slurm_marker_{value}.txt"
+            remaining = max(deadline - time.monotonic(), 0)
+            assert _wait_for_marker(marker, timeout_seconds=remaining), (
+                f"Marker for value={value} not created after 300s. "
+                f"The SLURM job may have failed or is still queued. "
+                f"Check: squeue -u $USER and "
+                f"logs in {tmp_path / 'sweep'}/.submitit/"
+            )
+            job_ids.append(ast.literal_eval(marker.read_text())["job_id"])
+
+        # Each task records the id SLURM gave it, "<array job id>_<task index>".
+        # Unlike polling squeue, this does not race the tasks leaving the queue.
+        array_ids = {job_id.split("_")[0] for job_id in job_ids}
+        assert len(array_ids) == 1, (
+            f"Jobs were not submitted as one array: {job_ids}"
         )
-        assert "Python" in result.stdout
+        task_ids = sorted(job_id.split("_")[1] for job_id in job_ids)
+        assert task_ids == ["0", "1", "2", "3"]
+
+    def test_container_health(self, apptainer_instance):
+        """Probe the container concurrently: Python runs and the plugin imports."""
+        # name -> (python code, expected stdout, hint on failure)
+        probes = {
+            "python": (
+                "import sys; print(f'Python {sys.version}')",
+                "Python",
+                "Python failed inside container.",
+            ),
+            "plugin": (
+                "from hydra_plugins.hydra_apptainer_launcher.submitit_launcher "
+                "import CustomSlurmLauncher; print('OK')",
+                "OK",
+                "Plugin import failed inside container. Make sure "
+                "hydra-apptainer-launcher is installed in the .sif image.",
+            ),
+        }
+
+        # The probes only wait on apptainer, so threads are enough to overlap them
+        with ThreadPoolExecutor(max_workers=len(probes)) as ex:
+            futures = {
+                name: ex.submit(
+                    subprocess.run,
+                    ["apptainer", "exec", apptainer_instance, "python", "-c", code],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                for name, (code, _, _) in probes.items()
+            }
+
+        failures = []
+        for name, (_, expected, hint) in probes.items():
+            result = futures[name].result()
+            if result.returncode != 0 or expected not in result.stdout:
+                failures.append(f"[{name}] {hint}\n{result.stderr}")
+        if failures:
+            pytest.fail("\n\n".join(failures))
@@ -0,0 +1,61 @@
+"""Unit tests for CustomSlurmLauncher behaviour (no SLURM cluster needed)."""
+
+import submitit
+from omegaconf import OmegaConf
+from submitit.slurm import slurm
+
+from hydra_plugins.hydra_apptainer_launcher.submitit_launcher import (
+    CustomSlurmLauncher,
+)
+
+
+def test_slurm_polling_interval_is_not_an_executor_param():
+    """Verify polling_interval_s is kept off the submitit executor parameters."""
+    launcher = CustomSlurmLauncher(partition="full", polling_interval_s=5)
+    assert launcher.polling_interval_s == 5
+    assert "polling_interval_s" not in launcher.params
+    assert launcher.params["partition"] == "full"
+
+
+def test_slurm_polling_interval_watcher_is_scoped_to_launch(tmp_path, monkeypatch):
+    """Verify the custom sacct watcher is used during launch() and then restored."""
+    default_watcher = slurm.SlurmJob.watcher
+    created = []
+    seen = {}
+
+    real_watcher = slurm.SlurmInfoWatcher
+
+    def recording_watcher(delay_s):
+        watcher = real_watcher(delay_s=delay_s)
+        created.append((delay_s, watcher))
+        return watcher
+
+    class FakeJob:
+        def results(self):
+            return ["ret"]
+
+    class FakeExecutor:
+        def __init__(self, **kwargs):
+            pass
+
+        def update_parameters(self, **kwargs):
+            pass
+
+        def map_array(self, fn, *args):
+            seen["watcher"] = slurm.SlurmJob.watcher
+            return [FakeJob() for _ in args[0]]
+
+    monkeypatch.setattr(slurm, "SlurmInfoWatcher", recording_watcher)
+    monkeypatch.setattr(submitit, "AutoExecutor", FakeExecutor)
+
+    launcher = CustomSlurmLauncher(
+        submitit_folder=str(tmp_path / ".submitit"), polling_interval_s=5
+    )
+    launcher.config = OmegaConf.create({"hydra": {"sweep": {"dir": str(tmp_path)}}})
+    assert launcher.launch([["a=1"], ["a=2"]], initial_job_idx=0) == ["ret", "ret"]
+
+    assert len(created) == 1
+    delay_s, watcher = created[0]
+    assert delay_s == 5
+    assert seen["watcher"] is watcher
+    assert slurm.SlurmJob.watcher is default_watcher